@@ -4,9 +4,8 @@
 import os
 from multiprocessing import set_start_method
 from pathlib import Path
-from typing import Optional, Type
+from typing import Callable, Dict, Optional, Type
 
-import psutil
 import typer
 from sxm import QualitySize, RegionChoice
 from sxm.cli import (
@@ -26,9 +25,19 @@ from sxm_player.models import PlayerState
 from sxm_player.players import BasePlayer
 from sxm_player.queue import EventMessage, EventTypes
 from sxm_player.runner import Runner
-from sxm_player.utils import ACTIVE_PROCESS_STATUSES
 from sxm_player.workers import ServerWorker, StatusWorker
 
+MAX_EVENTS_PER_LOOP = 50
+
+EVENT_HANDLERS: Dict[EventTypes, Callable] = {
+    event_type: getattr(handlers, f"handle_{event_type.name.lower()}_event")
+    for event_type in EventTypes
+    if hasattr(handlers, f"handle_{event_type.name.lower()}_event")
+}
+DEBUG_EVENTS = frozenset(
+    event_type for event_type in EventTypes if event_type.name.startswith("DEBUG")
+)
+
 OPTION_CONFIG_FILE = typer.Option(
     None,
     "-c",
@@ -102,6 +111,14 @@ def main(
     if player_class is not None:
         klass = player_class  # type: ignore
 
+    stream_folder: Optional[str] = None
+    archive_folder: Optional[str] = None
+    processed_folder: Optional[str] = None
+    if output_folder is not None:
+        stream_folder = os.path.join(output_folder, "streams")
+        archive_folder = os.path.join(output_folder, "archive")
+        processed_folder = os.path.join(output_folder, "processed")
+
     with Runner(log_file, verbose) as runner:
         state = PlayerState()
 
@@ -159,7 +176,23 @@ def event_loop(runner: Runner, state: PlayerState, **kwargs):
     if not event:
         return
 
-    runner.log.debug(f"Received event: {event.msg_src}, {event.msg_type.name}")
+    # handle everything that is already waiting so HLS updates can be
+    # coalesced and only the latest of each is relayed to the workers
+    handled = 0
+    while event is not None:
+        process_event(event, runner, state, **kwargs)
+
+        handled += 1
+        if handled >= MAX_EVENTS_PER_LOOP:
+            break
+        event = runner.event_queue.safe_get(timeout=None)
+
+    handlers.flush_hls_events(runner)
+    check_player(runner, state)
+
+
+def process_event(event: EventMessage, runner: Runner, state: PlayerState, **kwargs):
+    runner.log.debug("Received event: %s, %s", event.msg_src, event.msg_type.name)
 
     was_connected: Optional[bool] = None
     if event.msg_src == ServerWorker.NAME:
@@ -168,41 +201,31 @@ def event_loop(runner: Runner, state: PlayerState, **kwargs):
     handle_event(event=event, runner=runner, state=state, **kwargs)
 
     if was_connected is False and state.is_connected:
-        if not was_connected and state.is_connected:
-            runner.log.info(
-                f"SXM Client started. {len(state.channels)} channels available"
-            )
-
-            state.sxm_running = True
-            handlers.sxm_status_event(runner, EventTypes.SXM_STATUS, state.sxm_running)
+        runner.log.info(
+            "SXM Client started. %s channels available", len(state.channels)
+        )
 
-    check_player(runner, state)
+        state.sxm_running = True
+        handlers.sxm_status_event(runner, EventTypes.SXM_STATUS, state.sxm_running)
 
 
 def handle_event(event: EventMessage, **kwargs):
     runner = kwargs["runner"]
     debug = kwargs["verbose"]
-    event_name = event.msg_type.name.lower()
-    is_debug_event = event_name.startswith("debug")
-    handler_name = f"handle_{event_name}_event"
 
-    if hasattr(handlers, handler_name) and (not is_debug_event or debug):
-        getattr(handlers, handler_name)(event, **kwargs)
+    handler = EVENT_HANDLERS.get(event.msg_type)
+    if handler is not None and (event.msg_type not in DEBUG_EVENTS or debug):
+        handler(event, **kwargs)
     else:
-        runner.log.warning(f"Unknown event received: {event.msg_src}, {event.msg_type}")
+        runner.log.warning(
+            "Unknown event received: %s, %s", event.msg_src, event.msg_type
+        )
 
 
 def check_player(runner: Runner, state: PlayerState):
     if state.player_name is not None:
         player = runner.workers.get(state.player_name)
-        running = True
-
-        if player is None:
-            running = False
-        else:
-            process = psutil.Process(player.process.pid)
-            if process.status() not in ACTIVE_PROCESS_STATUSES:
-                running = False
+        running = player is not None and player.process.is_alive()
 
         if not running:
             runner.log.info("Player has stopped, shutting down")
@@ -1,8 +1,8 @@
-import os
-from typing import Optional
+import logging
+from typing import Optional, Union
 
 from sxm_player.models import PlayerState
-from sxm_player.queue import EventMessage, EventTypes
+from sxm_player.queue import EventMessage, EventTypes, PreserializedMessage, Queue
 from sxm_player.runner import Runner, Worker
 from sxm_player.workers import (
     ArchiveWorker,
@@ -14,69 +14,89 @@ from sxm_player.workers import (
 
 
 def hls_start_event(runner: Runner, stream_data: tuple, src: Optional[str] = None):
+    flush_hls_events(runner)
     hls_event(runner, EventTypes.HLS_STREAM_STARTED, stream_data, src=src)
 
 
 def hls_kill_event(runner: Runner, src: Optional[str] = None):
+    flush_hls_events(runner)
     hls_event(runner, EventTypes.KILL_HLS_STREAM, None, src=src)
 
 
 def hls_metadata_event(runner: Runner, live_data: tuple, src: Optional[str] = None):
-    hls_event(runner, EventTypes.UPDATE_METADATA, live_data, src=src)
+    queue_hls_event(runner, EventTypes.UPDATE_METADATA, live_data, src=src)
 
 
 def hls_channels_event(
     runner: Runner, channels: Optional[list], src: Optional[str] = None
 ):
-    hls_event(runner, EventTypes.UPDATE_CHANNELS, channels, src=src)
+    queue_hls_event(runner, EventTypes.UPDATE_CHANNELS, channels, src=src)
+
+
+def queue_hls_event(runner: Runner, event: EventTypes, data, src: Optional[str] = None):
+    """Queues a `hls_event` to be sent on the next `flush_hls_events`.
+    Only the latest data for each event type is kept."""
+
+    runner.pending_hls_events[event] = (data, src)
+
+
+def flush_hls_events(runner: Runner):
+    """Sends all queued `hls_event`s. Called before any immediate
+    `hls_event` as well so subscribers always see events in order."""
+
+    pending = runner.pending_hls_events.copy()
+    runner.pending_hls_events.clear()
+    for event, (data, src) in pending.items():
+        hls_event(runner, event, data, src=src)
 
 
 def hls_event(runner: Runner, event: EventTypes, data, src: Optional[str] = None):
-    for worker in runner.workers.values():
-        if worker.hls_stream_queue is not None:
-            if src is None:
-                push_event(
-                    runner,
-                    worker,
-                    "hls_stream_queue",
-                    EventMessage("main", event, data),
-                )
-            else:
-                push_event(
-                    runner,
-                    worker,
-                    "hls_stream_queue",
-                    EventMessage(src, event, data, msg_relay="main"),
-                )
+    subscribers = runner.hls_subscribers
+    if not subscribers:
+        return
+
+    message = _make_relay_message(event, data, src, len(subscribers))
+    for worker, queue in subscribers:
+        push_event(runner, worker, queue, message)
 
 
 def sxm_status_event(
     runner: Runner, event: EventTypes, status: bool, src: Optional[str] = None
 ):
-    for worker in runner.workers.values():
-        if worker.sxm_status_queue is not None:
-            if src is None:
-                push_event(
-                    runner,
-                    worker,
-                    "sxm_status_queue",
-                    EventMessage("main", event, status),
-                )
-            else:
-                push_event(
-                    runner,
-                    worker,
-                    "sxm_status_queue",
-                    EventMessage(src, event, status, msg_relay="main"),
-                )
-
-
-def push_event(runner: Runner, worker: Worker, queue_name: str, event: EventMessage):
-
-    success = getattr(worker, queue_name).safe_put(event)
+    subscribers = runner.sxm_subscribers
+    if not subscribers:
+        return
+
+    message = _make_relay_message(event, status, src, len(subscribers))
+    for worker, queue in subscribers:
+        push_event(runner, worker, queue, message)
+
+
+def _make_relay_message(
+    event: EventTypes, data, src: Optional[str] = None, subscribers: int = 1
+) -> Union[EventMessage, PreserializedMessage]:
+    if src is None:
+        message = EventMessage("main", event, data)
+    else:
+        message = EventMessage(src, event, data, msg_relay="main")
+
+    # pickle once for the whole fan-out instead of once per queue
+    if subscribers > 1:
+        return PreserializedMessage(message)
+    return message
+
+
+def push_event(
+    runner: Runner,
+    worker: Worker,
+    queue: Queue,
+    event: Union[EventMessage, PreserializedMessage],
+):
+
+    success = queue.safe_put(event)
 
     if not success:
-        runner.log.error(f"Could not pass status event to {worker.name}")
+        runner.log.error("Could not pass status event to %s", worker.name)
 
 
 def handle_update_channels_event(
@@ -84,9 +104,8 @@ def handle_update_channels_event(
 ):
     """event.msg == `PlayerState.get_raw_channels()`"""
 
-    state.update_channels(event.msg)
-
-    hls_channels_event(runner, state.get_raw_channels(), src=event.msg_src)
+    if state.update_channels(event.msg):
+        hls_channels_event(runner, state.get_raw_channels(), src=event.msg_src)
 
 
 def handle_reset_sxm_event(
@@ -101,10 +120,10 @@ def handle_reset_sxm_event(
         cooldown = state.increase_cooldown()
 
         runner.log.warning(
-            "SXM Client acting up, restarting it (cooldown: " f"{cooldown} seconds)"
+            "SXM Client acting up, restarting it (cooldown: %s seconds)", cooldown
         )
 
-        del runner.workers[ServerWorker.NAME]
+        runner.remove_worker(ServerWorker.NAME)
 
         state.sxm_running = False
         sxm_status_event(runner, EventTypes.SXM_STATUS, state.sxm_running)
@@ -116,15 +135,12 @@ def handle_trigger_hls_stream_event(
     state: PlayerState,
     host: str,
     port: int,
-    output_folder: str,
+    stream_folder: Optional[str],
     **kwargs,
 ):
     """event.msg == (channel_name: str, stream_protocol: str)"""
 
     hls_worker = runner.workers.get(HLSWorker.NAME)
-    stream_folder: Optional[str] = None
-    if output_folder is not None:
-        stream_folder = os.path.join(output_folder, "streams")
 
     if hls_worker is not None:
         src_worker = runner.workers.get(event.msg_src)
@@ -132,20 +148,21 @@ def handle_trigger_hls_stream_event(
             push_event(
                 runner,
                 src_worker,
-                "hls_stream_queue",
+                src_worker.hls_stream_queue,
                 EventMessage(
                     event.msg_src, EventTypes.HLS_STREAM_STARTED, state.stream_data
                 ),
             )
             runner.log.info(
-                f"Could not start new {HLSWorker.NAME}, one is "
-                "already running passing "
-                f"{EventTypes.HLS_STREAM_STARTED} instead"
+                "Could not start new %s, one is already running passing %s instead",
+                HLSWorker.NAME,
+                EventTypes.HLS_STREAM_STARTED,
             )
         else:
             runner.log.warning(
-                f"Could not start new {HLSWorker.NAME}, one is "
-                "already running and no request was not HLSPlayer"
+                "Could not start new %s, one is "
+                "already running and no request was not HLSPlayer",
+                HLSWorker.NAME,
             )
     elif state.get_channel(event.msg[0]) is not None:
         runner.create_worker(
@@ -161,7 +178,7 @@ def handle_trigger_hls_stream_event(
         state.stream_channel = event.msg
     else:
         runner.log.warning(
-            f"Could not start new {HLSWorker.NAME}, invalid " f"channel id: {event.msg}"
+            "Could not start new %s, invalid channel id: %s", HLSWorker.NAME, event.msg
         )
 
 
@@ -182,41 +199,39 @@ def handle_kill_hls_stream_event(
         if worker is not None:
             worker.full_stop()
 
-            runner.log.info(f"Terminated {worker_name} worker")
+            runner.log.info("Terminated %s worker", worker_name)
 
-            del runner.workers[worker_name]
+            runner.remove_worker(worker_name)
 
 
 def handle_hls_stream_started_event(
     event: EventMessage,
     runner: Runner,
     state: PlayerState,
-    output_folder: str,
+    stream_folder: Optional[str],
+    archive_folder: Optional[str],
+    processed_folder: Optional[str],
     reset_songs: bool,
     **kwargs,
 ):
     """event.msg == (channel_name: str, stream_url: str)"""
 
-    stream_folder: Optional[str] = None
-    archive_folder: Optional[str] = None
-    processed_folder: Optional[str] = None
-    if output_folder is not None:
-        stream_folder = os.path.join(output_folder, "streams")
-        archive_folder = os.path.join(output_folder, "archive")
-        processed_folder = os.path.join(output_folder, "processed")
-
     state.update_stream_data(event.msg)
     hls_start_event(runner, state.stream_data, src=event.msg_src)
 
-    if output_folder is not None:
+    if archive_folder is not None:
+        stream_data = state.stream_data
+        raw_channels = state.get_raw_channels()
+        raw_live = state.get_raw_live()
+
         runner.create_worker(
             ArchiveWorker,
             ArchiveWorker.NAME,
             stream_folder=stream_folder,
             archive_folder=archive_folder,
-            stream_data=state.stream_data,
-            channels=state.get_raw_channels(),
-            raw_live_data=state.get_raw_live(),
+            stream_data=stream_data,
+            channels=raw_channels,
+            raw_live_data=raw_live,
         )
 
         runner.create_worker(
@@ -225,9 +240,9 @@ def handle_hls_stream_started_event(
             processed_folder=processed_folder,
             archive_folder=archive_folder,
             reset_songs=reset_songs,
-            stream_data=state.stream_data,
-            channels=state.get_raw_channels(),
-            raw_live_data=state.get_raw_live(),
+            stream_data=stream_data,
+            channels=raw_channels,
+            raw_live_data=raw_live,
         )
 
 
@@ -236,6 +251,10 @@ def handle_update_metadata_event(
 ):
     """event.msg == (state.get_raw_live())"""
 
+    # playlist refreshes often resend the exact same live data
+    if event.msg == state.get_raw_live()[2]:
+        return
+
     state.stream_channel = event.msg["moduleResponse"]["liveChannelData"]["channelId"]
     state.update_live(event.msg)
     hls_metadata_event(runner, state.get_raw_live(), src=event.msg_src)
@@ -246,14 +265,11 @@ def handle_hls_stderror_lines_event(
 ):
     """event.msg == lines: List[str]"""
 
-    do_reset = False
-    for line in event.msg:
-        runner.log.debug(f"ffmpeg STDERR: {line}")
-
-        if "503" in line:
-            do_reset = True
+    if runner.log.isEnabledFor(logging.DEBUG):
+        for line in event.msg:
+            runner.log.debug("ffmpeg STDERR: %s", line)
 
-    if do_reset:
+    if "503" in "\n".join(event.msg):
         handle_reset_sxm_event(event, runner, state)
 
 
@@ -273,7 +289,7 @@ def handle_debug_start_player_event(
 
     if state.stream_channel is not None and channel_id not in state.stream_channel:
         runner.log.warning(
-            "Cannot start player, different HLS stream " f"playing: {state.stream_url}"
+            "Cannot start player, different HLS stream playing: %s", state.stream_url
         )
     else:
         runner.create_worker(
@@ -293,6 +309,6 @@ def handle_debug_stop_player_event(event: EventMessage, runner: Runner, **kwargs
 
     worker = runner.workers.get(event.msg)
     if worker is None:
-        runner.log.warning(f"Debug Player {event.msg} is not currently running")
+        runner.log.warning("Debug Player %s is not currently running", event.msg)
     else:
         worker.full_stop()
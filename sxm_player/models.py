@@ -1,10 +1,11 @@
 import logging
 import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, PrivateAttr  # pylint: disable=no-name-in-module
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm.session import Session
 from sxm.models import XMChannel, XMLiveChannel
@@ -12,12 +13,14 @@ from sxm.models import XMChannel, XMLiveChannel
 COOLDOWN_SHORT = 10
 COOLDOWN_MED = 60
 COOLDOWN_LONG = 600
+PRETTY_NAME_CACHE_SIZE = 256
 
 Base = declarative_base()
 
 
 class DBSong(Base):
     __tablename__ = "songs"
+    __table_args__ = (Index("ix_songs_title_artist", "title", "artist"),)
 
     guid = Column(String, primary_key=True)
     title = Column(String, index=True)
@@ -47,6 +50,7 @@ class Song(BaseModel):
         return self.air_time.replace(tzinfo=timezone.utc)
 
     @staticmethod
+    @lru_cache(maxsize=PRETTY_NAME_CACHE_SIZE)
     def get_pretty_name(
         title: Optional[str], artist: Optional[str], bold: bool = False
     ) -> str:
@@ -102,6 +106,7 @@ class Episode(BaseModel):
         orm_mode = True
 
     @staticmethod
+    @lru_cache(maxsize=PRETTY_NAME_CACHE_SIZE)
     def get_pretty_name(
         title: Optional[str],
         show: Optional[str],
@@ -174,15 +179,29 @@ class PlayerState(BaseModel):
             if self._raw_channels is None:
                 return []
             self._channels = []
-            for channel in self._raw_channels:
-                self._channels.append(XMChannel.from_dict(channel))
+            self._channels_lookup_cache = {}
+            for raw_channel in self._raw_channels:
+                channel = XMChannel.from_dict(raw_channel)
+                self._channels.append(channel)
+
+                # index by every name `get_channel` accepts, first one wins
+                for key in (
+                    channel.name.lower(),
+                    channel.id.lower(),
+                    str(channel.channel_number),
+                ):
+                    self._channels_lookup_cache.setdefault(key, channel)
         return self._channels
 
-    def update_channels(self, value: Optional[List[dict]]) -> None:
+    def update_channels(self, value: Optional[List[dict]]) -> bool:
         """
-        Sets channel key in internal `_raw_channels`.
+        Sets channel key in internal `_raw_channels`. Returns `False` if
+        the channels are unchanged and nothing was updated.
         """
 
+        if value is not None and value == self._raw_channels:
+            return False
+
         self._channels = None
         self._channels_lookup_cache = {}
         self._raw_channels = value
@@ -190,6 +209,7 @@ class PlayerState(BaseModel):
         if self._raw_channels is None:
             self.stream_url = None
             self.stream_channel = None
+        return True
 
     def get_raw_channels(self) -> Optional[List[dict]]:
         return self._raw_channels
@@ -283,7 +303,7 @@ class PlayerState(BaseModel):
             extra_seconds = self.increase_cooldown()
 
             logger.info(
-                "Attempting to connect SXM Client (next in " f"{extra_seconds} seconds)"
+                "Attempting to connect SXM Client (next in %s seconds)", extra_seconds
             )
             return True
         return False
@@ -309,14 +329,6 @@ class PlayerState(BaseModel):
     def get_channel(self, name: str) -> Optional[XMChannel]:
         """Returns channel from list of `channels` with given name"""
 
-        name = name.lower()
-        if name not in self._channels_lookup_cache:
-            for channel in self.channels:
-                if (
-                    channel.name.lower() == name
-                    or channel.id.lower() == name
-                    or str(channel.channel_number) == name
-                ):
-                    self._channels_lookup_cache[name] = channel
-                    break
-        return self._channels_lookup_cache.get(name)
+        if not self.channels:
+            return None
+        return self._channels_lookup_cache.get(name.lower())
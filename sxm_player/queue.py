@@ -1,9 +1,10 @@
 import multiprocessing.queues as mpq
+import pickle  # nosec
 import time
 from enum import Enum, auto
 from multiprocessing import get_context
 from queue import Empty, Full
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 DEFAULT_POLLING_TIMEOUT = 0.02
 
@@ -21,7 +22,17 @@ class EventTypes(Enum):
     DEBUG_STOP_PLAYER = auto()
 
 
+def _load_event_message(data: bytes) -> "EventMessage":
+    fields = pickle.loads(data)  # nosec
+
+    event = EventMessage.__new__(EventMessage)
+    event.id, event.msg_src, event.msg_relay, event.msg_type, event.msg = fields
+    return event
+
+
 class EventMessage:
+    __slots__ = ("id", "msg_src", "msg_relay", "msg_type", "msg")
+
     id: float  # noqa: A003
     msg_src: str
     msg_relay: str
@@ -39,6 +50,25 @@ class EventMessage:
         return f"{self.msg_src} - {self.msg_type}: {self.msg}"
 
 
+class PreserializedMessage:
+    """`EventMessage` pickled once up front so it can be put on several
+    queues without serializing the payload again for each one. Unpickles
+    as a plain `EventMessage`."""
+
+    __slots__ = ("data",)
+
+    data: bytes
+
+    def __init__(self, event: EventMessage):
+        self.data = pickle.dumps(
+            (event.id, event.msg_src, event.msg_relay, event.msg_type, event.msg),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    def __reduce__(self):
+        return (_load_event_message, (self.data,))
+
+
 class Queue(mpq.Queue):
     # -- See StackOverflow Article :
     #   https://stackoverflow.com/questions/39496554/cannot-subclass-multiprocessing-queue-in-python-3-5
@@ -50,8 +80,15 @@ class Queue(mpq.Queue):
         ctx = get_context()
         super().__init__(*args, **kwargs, ctx=ctx)
 
+    @property
+    def reader(self):
+        """Read end of the underlying pipe, can be passed to
+        `multiprocessing.connection.wait`"""
+
+        return self._reader  # type: ignore
+
     def safe_get(
-        self, timeout: float = DEFAULT_POLLING_TIMEOUT
+        self, timeout: Optional[float] = DEFAULT_POLLING_TIMEOUT
     ) -> Optional[EventMessage]:
         try:
             if timeout is None:
@@ -62,7 +99,9 @@ class Queue(mpq.Queue):
             return None
 
     def safe_put(
-        self, item: EventMessage, timeout: float = DEFAULT_POLLING_TIMEOUT
+        self,
+        item: Union[EventMessage, PreserializedMessage],
+        timeout: float = DEFAULT_POLLING_TIMEOUT,
     ) -> bool:
         try:
             self.put(item, block=False, timeout=timeout)
@@ -2,9 +2,9 @@ import logging
 import time
 from multiprocessing import Event, Process, synchronize
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
-from sxm_player.queue import Queue
+from sxm_player.queue import EventTypes, Queue
 from sxm_player.signals import default_signal_handler, init_signals
 from sxm_player.utils import configure_root_logger
 from sxm_player.workers import BaseWorker, HLSStatusSubscriber, SXMStatusSubscriber
@@ -102,7 +102,7 @@ class Worker:
             kwargs=kwargs,
         )
 
-        self.log.debug(f"Starting worker: {name}")
+        self.log.debug("Starting worker: %s", name)
         self.process.start()
 
         timeout = STARTUP_WAIT_SECS
@@ -111,7 +111,7 @@ class Worker:
 
         started = self.startup_event.wait(timeout=timeout)
 
-        self.log.debug(f"Startup Event: {name} got {started}")
+        self.log.debug("Startup Event: %s got %s", name, started)
         if not started:
             self.terminate()
             raise RuntimeError(
@@ -119,30 +119,30 @@ class Worker:
             )
 
     def full_stop(self, wait_time=STOP_WAIT_SECS):
-        self.log.debug(f"stopping: {self.name}")
+        self.log.debug("stopping: %s", self.name)
         self.local_shutdown_event.set()
         self.process.join(wait_time)
         if self.process.is_alive():
             self.terminate()
 
     def terminate(self):
-        self.log.debug(f"Terminating: {self.name}")
+        self.log.debug("Terminating: %s", self.name)
 
         NUM_TRIES = 3
         tries = NUM_TRIES
         while tries and self.process.is_alive():
             self.process.terminate()
-            time.sleep(0.01)
+            self.process.join(0.01)
             tries -= 1
 
         if self.process.is_alive():
             self.log.error(
-                f"Failed to terminate {self.name} after {NUM_TRIES} attempts"
+                "Failed to terminate %s after %s attempts", self.name, NUM_TRIES
             )
             return False
         else:
             self.log.info(
-                f"Terminated {self.name} after {NUM_TRIES - tries} attempt(s)"
+                "Terminated %s after %s attempt(s)", self.name, NUM_TRIES - tries
             )
             return True
 
@@ -158,10 +158,15 @@ class Runner:
     log: logging.Logger
     log_level: str
     log_file: Optional[Path]
+    pending_hls_events: Dict[EventTypes, Tuple[Any, Optional[str]]]
+
+    _hls_subscribers: Optional[List[Tuple[Worker, Queue]]] = None
+    _sxm_subscribers: Optional[List[Tuple[Worker, Queue]]] = None
 
     def __init__(self, log_file: Optional[Path], debug: bool):
         self.workers = {}
         self.queues = []
+        self.pending_hls_events = {}
         self.shutdown_event = Event()
         self.event_queue = self.create_queue()
 
@@ -184,7 +189,7 @@ class Runner:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type:
             self.log.error(
-                f"Exception: {exc_val}", exc_info=(exc_type, exc_val, exc_tb)
+                "Exception: %s", exc_val, exc_info=(exc_type, exc_val, exc_tb)
             )
 
         self.stop_workers()
@@ -216,6 +221,7 @@ class Runner:
                 still_running[worker.name] = worker
 
         self.workers = still_running
+        self._reset_subscribers()
         return num_failed, num_terminated
 
     def stop_worker(self, worker) -> Tuple[int, int, bool]:
@@ -232,11 +238,11 @@ class Runner:
             exitcode = worker.process.exitcode
             if exitcode:
                 self.log.error(
-                    (f"Process {worker.name} ended with " f"exitcode {exitcode}")
+                    "Process %s ended with exitcode %s", worker.name, exitcode
                 )
                 terminated = 2
             else:
-                self.log.debug(f"Process {worker.name} stopped successfully")
+                self.log.debug("Process %s stopped successfully", worker.name)
 
         return (terminated, failed, running)
 
@@ -286,4 +292,38 @@ class Runner:
             **kwargs,
         )
         self.workers[name] = worker
+        self._reset_subscribers()
+        return worker
+
+    def remove_worker(self, name: str) -> Optional[Worker]:
+        worker = self.workers.pop(name, None)
+        self._reset_subscribers()
         return worker
+
+    @property
+    def hls_subscribers(self) -> List[Tuple[Worker, Queue]]:
+        """Returns workers listening on a `hls_stream_queue` with the queue"""
+
+        if self._hls_subscribers is None:
+            self._hls_subscribers = [
+                (w, w.hls_stream_queue)
+                for w in self.workers.values()
+                if w.hls_stream_queue is not None
+            ]
+        return self._hls_subscribers
+
+    @property
+    def sxm_subscribers(self) -> List[Tuple[Worker, Queue]]:
+        """Returns workers listening on a `sxm_status_queue` with the queue"""
+
+        if self._sxm_subscribers is None:
+            self._sxm_subscribers = [
+                (w, w.sxm_status_queue)
+                for w in self.workers.values()
+                if w.sxm_status_queue is not None
+            ]
+        return self._sxm_subscribers
+
+    def _reset_subscribers(self) -> None:
+        self._hls_subscribers = None
+        self._sxm_subscribers = None
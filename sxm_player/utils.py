@@ -1,27 +1,39 @@
 import logging
 import os
-import select
 import shlex
 import subprocess  # nosec
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Union
+from queue import Empty, SimpleQueue
+from threading import Thread
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import coloredlogs  # type: ignore
-import psutil
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 from sxm.models import XMArt, XMImage
 
 from sxm_player.models import DBEpisode, DBSong
 
-ACTIVE_PROCESS_STATUSES = [
-    psutil.STATUS_RUNNING,
-    psutil.STATUS_SLEEPING,
-    psutil.STATUS_DISK_SLEEP,
-]
 FS_DATETIME_FORMAT = "%Y%m%d-%H%M%S%z"
+# stay under SQLite's bound parameter limit for IN clauses
+DB_CHUNK_SIZE = 500
+
+T = TypeVar("T")
 
 
 unrelated_loggers = [
@@ -35,6 +47,45 @@ unrelated_loggers = [
 logger = logging.getLogger("sxm_player.utils")
 
 
+def chunked(items: Iterable[T], size: int = DB_CHUNK_SIZE) -> Iterator[List[T]]:
+    """Splits `items` into lists of at most `size` items"""
+
+    iterator = iter(items)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers keep going while the processor is writing
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _delete_missing(
+    db_session: Session, model: Union[Type[DBSong], Type[DBEpisode]]
+) -> int:
+    """Deletes all rows of `model` whose file no longer exists"""
+
+    rows = db_session.query(model.guid, model.file_path).all()
+    if len(rows) == 0:
+        return 0
+
+    # checking the files is just stat calls, so do them in parallel
+    with ThreadPoolExecutor() as pool:
+        found = pool.map(os.path.exists, [file_path for _, file_path in rows])
+        missing = [guid for (guid, _), exists in zip(rows, found) if not exists]
+
+    for guids in chunked(missing):
+        db_session.query(model).filter(model.guid.in_(guids)).delete(
+            synchronize_session=False
+        )
+    return len(missing)
+
+
 def init_db(
     base_folder: str,
     cleanup: Optional[bool] = True,
@@ -52,24 +103,23 @@ def init_db(
         logger.info("Reseting database...")
         os.remove(song_db)
 
-    db_engine = create_engine(f"sqlite:///{song_db}")
+    # SQLAlchemy defaults to NullPool for sqlite files, which reconnects
+    # after every commit
+    db_engine = create_engine(f"sqlite:///{song_db}", poolclass=QueuePool)
+    event.listen(db_engine, "connect", _set_sqlite_pragmas)
     Base.metadata.create_all(db_engine)
+    # create_all skips existing tables, so add any newer indexes to them
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db_engine, checkfirst=True)
     db_session = sessionmaker(bind=db_engine)()
 
     if cleanup:
-        removed = 0
-        for song in db_session.query(DBSong).all():
-            if not os.path.exists(song.file_path):
-                removed += 1
-                db_session.delete(song)
-
-        for show in db_session.query(DBEpisode).all():
-            if not os.path.exists(show.file_path):
-                removed += 1
-                db_session.delete(show)
+        removed = _delete_missing(db_session, DBSong)
+        removed += _delete_missing(db_session, DBEpisode)
 
         if removed > 0:
-            logger.warn(f"deleted missing songs/shows: {removed}")
+            logger.warning("deleted missing songs/shows: %s", removed)
             db_session.commit()
 
     logger.info("Database initalized")
@@ -108,21 +158,19 @@ def get_art_thumb_url(arts: List[XMArt]) -> Optional[str]:
 def get_files(folder: str) -> List[str]:
     """Gets list of files in a folder"""
 
-    dir_list = os.listdir(folder)
+    return [entry.name for entry in get_file_entries(folder)]
 
-    files = []
-    for dir_item in dir_list:
-        abs_path = os.path.join(folder, dir_item)
-        if os.path.isfile(abs_path):
-            files.append(dir_item)
 
-    return files
+def get_file_entries(folder: str) -> List["os.DirEntry[str]"]:
+    """Gets list of `os.DirEntry` for files in a folder, use when the full
+    path or stat results are needed"""
 
+    with os.scandir(folder) as entries:
+        return [entry for entry in entries if entry.is_file()]
 
-def splice_file(
-    input_file: str, output_file: str, start_time: int, end_time: int
-) -> Union[str, None]:
-    """Splices a chunk off of the input file and saves it"""
+
+def _run_ffmpeg(job: Tuple[str, str, int, int]) -> Union[str, None]:
+    input_file, output_file, start_time, end_time = job
 
     ffmpeg_command = 'ffmpeg -y -i "{}" -acodec copy -ss {} -to {} -loglevel fatal "{}"'
     args = shlex.split(
@@ -134,13 +182,34 @@ def splice_file(
     try:
         subprocess.run(args, check=True)  # nosec
     except subprocess.CalledProcessError as e:
-        logger.error(f"failed to split file: {e}")
+        logger.error("failed to split file: %s", e)
         return None
     else:
-        logger.info(f"spliced file: {output_file}")
+        logger.info("spliced file: %s", output_file)
         return output_file
 
 
+def splice_file(
+    input_file: str, output_file: str, start_time: int, end_time: int
+) -> Union[str, None]:
+    """Splices a chunk off of the input file and saves it"""
+
+    return _run_ffmpeg((input_file, output_file, start_time, end_time))
+
+
+def splice_files(jobs: List[Tuple[str, str, int, int]]) -> List[Union[str, None]]:
+    """Splices multiple chunks in parallel, `jobs` is a list of
+    `(input_file, output_file, start_time, end_time)`. Results are
+    returned in the same order as `jobs`"""
+
+    if len(jobs) < 2:
+        return [_run_ffmpeg(job) for job in jobs]
+
+    # each job blocks on its own ffmpeg process, so threads are enough
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        return list(pool.map(_run_ffmpeg, jobs))
+
+
 def create_fs_datetime(dt):
     return dt.strftime(FS_DATETIME_FORMAT)
 
@@ -166,48 +235,66 @@ def configure_root_logger(level: str, log_file: Optional[Path] = None):
         logging.getLogger(logger).setLevel(logging.INFO)
 
 
+def _read_stderr(stderr: IO[bytes], lines: "SimpleQueue[str]") -> None:
+    for line in iter(stderr.readline, b""):
+        lines.put(line.decode("utf8", errors="replace"))
+
+
 class FFmpeg:
     command: str
     process: Optional[subprocess.Popen] = None
 
-    _stderr_poll: Optional[select.poll] = None
+    _stderr_lines: Optional["SimpleQueue[str]"] = None
+    _stderr_thread: Optional[Thread] = None
 
     def start_ffmpeg(self) -> None:
         ffmpeg_args = shlex.split(self.command)
 
         self.process = subprocess.Popen(ffmpeg_args, stderr=subprocess.PIPE)  # nosec
 
-        self._stderr_poll = select.poll()
-
+        # read stderr in the background so the worker loop never blocks
+        # on it and ffmpeg never blocks on a full pipe
+        self._stderr_lines = SimpleQueue()
         if self.process.stderr is not None:
-            self._stderr_poll.register(self.process.stderr, select.POLLIN)
+            self._stderr_thread = Thread(
+                target=_read_stderr,
+                args=(self.process.stderr, self._stderr_lines),
+                daemon=True,
+            )
+            self._stderr_thread.start()
 
     def check_process(self) -> bool:
         if self.process is None:
             return False
 
-        process = psutil.Process(self.process.pid)
-        status = process.status()
-
-        return status in ACTIVE_PROCESS_STATUSES
+        return self.process.poll() is None
 
     def stop_ffmpeg(self) -> None:
         if self.process is None:
             return
 
         self.process.kill()
-        if self.process.poll() is None:
-            self.process.communicate()
+        self.process.wait()
+
+        # killed process closes its end of the pipe, so the reader hits EOF
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=1)
+        if self.process.stderr is not None:
+            self.process.stderr.close()
 
         self.process = None
+        self._stderr_lines = None
+        self._stderr_thread = None
 
     def read_errors(self) -> List[str]:
-        if self.process is None or self._stderr_poll is None:
+        if self._stderr_lines is None:
             return []
 
         lines: List[str] = []
-        while self._stderr_poll.poll(0.1):
-            if self.process.stderr is not None:
-                lines.append(self.process.stderr.readline().decode("utf8"))
+        try:
+            while True:
+                lines.append(self._stderr_lines.get_nowait())
+        except Empty:
+            pass
 
         return lines
@@ -4,7 +4,7 @@ from time import monotonic
 from typing import Dict, Optional, Tuple, Union
 
 from sxm_player.queue import EventMessage, EventTypes
-from sxm_player.utils import create_fs_datetime, get_files, splice_file
+from sxm_player.utils import create_fs_datetime, get_file_entries, splice_file
 from sxm_player.workers.base import HLSLoopedWorker
 
 __all__ = ["ArchiveWorker"]
@@ -19,7 +19,7 @@ class ArchiveWorker(HLSLoopedWorker):
 
     stream_folder: str
     archive_folder: str
-    last_size: Dict[str, int] = {}
+    last_size: Dict[str, int]
 
     _delay: float = ARCHIVE_CHUNK.total_seconds()
 
@@ -32,6 +32,7 @@ class ArchiveWorker(HLSLoopedWorker):
 
         self.stream_folder = stream_folder
         self.archive_folder = archive_folder
+        self.last_size = {}
 
         os.makedirs(self.stream_folder, exist_ok=True)
         os.makedirs(self.archive_folder, exist_ok=True)
@@ -43,15 +44,19 @@ class ArchiveWorker(HLSLoopedWorker):
 
         deleted = 0
         archived = None
-        stream_files = get_files(self.stream_folder)
-
-        for stream_file in stream_files:
-            abs_path = os.path.join(self.stream_folder, stream_file)
+        abs_paths = [entry.path for entry in get_file_entries(self.stream_folder)]
+        for abs_path in abs_paths:
             archived, removed = self._process_file(abs_path)
             deleted += removed
 
+        # only keep sizes for stream files that still exist
+        current_paths = set(abs_paths)
+        self.last_size = {
+            path: size for path, size in self.last_size.items() if path in current_paths
+        }
+
         self._log.info(
-            f"archived: deleted files: {deleted}, " f"archived file: {archived}"
+            "archived: deleted files: %s, archived file: %s", deleted, archived
         )
 
     def _process_file(self, abs_path) -> Tuple[Optional[str], int]:
@@ -97,13 +102,12 @@ class ArchiveWorker(HLSLoopedWorker):
     ) -> int:
         """Deletes any old versions of archive that is about to be made"""
 
-        archive_files = get_files(archive_folder)
-
         now = datetime.now(timezone.utc)
         removed: int = 0
-        for archive_file in archive_files:
-            abs_path = os.path.join(archive_folder, archive_file)
-            access_time = datetime.fromtimestamp(os.path.getatime(abs_path)).replace(
+        for entry in get_file_entries(archive_folder):
+            archive_file = entry.name
+            abs_path = entry.path
+            access_time = datetime.fromtimestamp(entry.stat().st_atime).replace(
                 tzinfo=timezone.utc
             )
 
@@ -112,7 +116,7 @@ class ArchiveWorker(HLSLoopedWorker):
                 archive_file.startswith(archive_base) and archive_file != current_file
             ) or age > ARCHIVE_DROPOFF:
 
-                self._log.debug(f"deleted old archive: {abs_path}")
+                self._log.debug("deleted old archive: %s", abs_path)
                 os.remove(abs_path)
                 removed += 1
         return removed
@@ -2,12 +2,15 @@ import logging
 import time
 from datetime import datetime, timedelta
 from multiprocessing import synchronize
+from multiprocessing.connection import wait
 from typing import List, Optional, Tuple
 
 from ..models import PlayerState
 from ..queue import EventMessage, EventTypes, Queue
 from ..signals import default_signal_handler, init_signals, interupt_signal_handler
 
+MAX_EVENT_WAIT = 0.25
+
 __all__ = [
     "BaseWorker",
     "InterruptableWorker",
@@ -69,7 +72,9 @@ class BaseWorker:
         success = self.event_queue.safe_put(event)
 
         if not success:
-            self._log.error(f"Could not pass event: {event.msg_src}, {event.msg_type}")
+            self._log.error(
+                "Could not pass event: %s, %s", event.msg_src, event.msg_type
+            )
 
 
 class InterruptableWorker(BaseWorker):
@@ -121,18 +126,25 @@ class EventedWorker(LoopedWorker):
     def run(self):
         self.setup()
 
+        readers = {queue.reader: queue for queue in self._event_queues}
         try:
             while (
                 not self.shutdown_event.is_set()
                 and not self.local_shutdown_event.is_set()
             ):
-                for queue in self._event_queues:
-                    event = queue.safe_get()
+                # block until an event arrives or the next loop is due,
+                # capped so shutdown is still noticed quickly
+                timeout = self._last_loop + self._delay - time.monotonic()
+                timeout = max(0, min(timeout, MAX_EVENT_WAIT))
+
+                for reader in wait(list(readers), timeout=timeout):
+                    event = readers[reader].safe_get(timeout=None)
 
                     if event:
                         self._log.debug(
-                            f"Received event: {event.msg_src}, "
-                            f"{event.msg_type.name}"
+                            "Received event: %s, %s",
+                            event.msg_src,
+                            event.msg_type.name,
                         )
                         self._handle_event(event)
 
@@ -140,7 +152,7 @@ class EventedWorker(LoopedWorker):
                     self.loop()
                     self._last_loop = time.monotonic()
         except Exception as e:
-            self._log.error(f"Exception occurred in {self.name}: {e}")
+            self._log.error("Exception occurred in %s: %s", self.name, e)
 
         self.cleanup()
 
@@ -165,7 +177,7 @@ class SXMLoopedWorker(EventedWorker, SXMStatusSubscriber):
             self._state.sxm_running = event.msg
         else:
             self._log.warning(
-                f"Unknown event received: {event.msg_src}, {event.msg_type}"
+                "Unknown event received: %s, %s", event.msg_src, event.msg_type
             )
 
 
@@ -208,7 +220,7 @@ class HLSLoopedWorker(EventedWorker, HLSStatusSubscriber):
             self.local_shutdown_event.set()
         else:
             self._log.warning(
-                f"Unknown event received: {event.msg_src}, {event.msg_type}"
+                "Unknown event received: %s, %s", event.msg_src, event.msg_type
             )
 
 
@@ -33,19 +33,19 @@ class CLIPlayerWorker(ComboLoopedWorker, FFmpeg):
     def _valid_stream_loop(self):
         if self.process is None:
             if self._state.stream_url is not None:
-                self._log.info(f"Starting new HLS player: {self._state.stream_url}")
+                self._log.info("Starting new HLS player: %s", self._state.stream_url)
                 self.command = FFMPEG_COMMAND.format(
                     self._state.stream_url, self.filename
                 )
 
                 time.sleep(3)
-                self._log.info(f"CLI Player start: {self.name}")
+                self._log.info("CLI Player start: %s", self.name)
                 self.start_ffmpeg()
         elif not self.check_process():
             self._log.info("ffmpeg process is not active, removing ffmpeg process")
             self.cleanup()
         else:
-            # read errors must be ran to prevent deadlock
+            # drain stderr lines so they do not pile up
             self.read_errors()
 
     def _invalid_stream_loop(self):
@@ -54,7 +54,7 @@ class CLIPlayerWorker(ComboLoopedWorker, FFmpeg):
                 now = time.monotonic()
                 if now > self._event_cooldown:
                     self._event_cooldown = now + 10
-                    self._log.info(f"Starting new HLS stream: {self.channel_id}")
+                    self._log.info("Starting new HLS stream: %s", self.channel_id)
                     self.push_event(
                         EventMessage(
                             self.name,
@@ -84,5 +84,5 @@ class CLIPlayerWorker(ComboLoopedWorker, FFmpeg):
             self.cleanup()
         else:
             self._log.warning(
-                f"Unknown event received: {event.msg_src}, {event.msg_type}"
+                "Unknown event received: %s, %s", event.msg_src, event.msg_type
             )
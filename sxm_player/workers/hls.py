@@ -1,6 +1,7 @@
 import os
 import tempfile
 import time
+from contextlib import suppress
 from typing import Optional, Tuple
 
 from ..queue import EventMessage, EventTypes
@@ -55,7 +56,7 @@ class HLSWorker(SXMLoopedWorker, FFmpeg):
         if stream_folder is not None:
             self.stream_file = os.path.join(stream_folder, f"{channel_id}.mp3")
 
-            if os.path.exists(self.stream_file):
+            with suppress(FileNotFoundError):
                 os.remove(self.stream_file)
 
             log_message += f" ({self.stream_file})"
@@ -71,7 +72,7 @@ class HLSWorker(SXMLoopedWorker, FFmpeg):
     ) -> Tuple[str, str]:
         if stream_protocol not in FFMPEG_PROTOCOLS:
             self._log.warning(
-                f"Unknown stream protocol: {stream_protocol}, " "defaulting to udp"
+                "Unknown stream protocol: %s, defaulting to udp", stream_protocol
             )
             stream_protocol = "udp"
 
@@ -87,7 +88,7 @@ class HLSWorker(SXMLoopedWorker, FFmpeg):
         #     output_options = f"-listen 1 {playback_url}"
         else:
             socket_file = os.path.join(tempfile.gettempdir(), f"{channel_id}.sock")
-            if os.path.exists(socket_file):
+            with suppress(FileNotFoundError):
                 os.remove(socket_file)
 
             playback_url = f"unix:/{socket_file}"
@@ -110,11 +111,11 @@ class HLSWorker(SXMLoopedWorker, FFmpeg):
         now = time.monotonic()
 
         if not self._state.sxm_running:
-            self._log.info(f"SXM Client is dead, stopping {self.name}")
+            self._log.info("SXM Client is dead, stopping %s", self.name)
             self.local_shutdown_event.set()
             return
         elif not self.check_process():
-            self._log.info(f"ffmpeg process is not active, stopping {self.name}")
+            self._log.info("ffmpeg process is not active, stopping %s", self.name)
             self.local_shutdown_event.set()
             return
         elif (
@@ -122,14 +123,14 @@ class HLSWorker(SXMLoopedWorker, FFmpeg):
             and self.stream_file is not None
             and not os.path.exists(self.stream_file)
         ):
-            self._log.info(f"stream file missing, stopping {self.name}")
+            self._log.info("stream file missing, stopping %s", self.name)
             self.local_shutdown_event.set()
             return
 
         lines = self.read_errors()
 
         if len(lines) > 0:
-            self._log.debug(f"adding {len(lines)} of stderr to shared memory")
+            self._log.debug("adding %s of stderr to shared memory", len(lines))
             self.push_event(
                 EventMessage(self.name, EventTypes.HLS_STDERROR_LINES, lines)
             )
@@ -1,17 +1,22 @@
 import os
-from datetime import timedelta
+import re
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timedelta
 from time import monotonic
-from typing import Dict, List, Optional, Union
+from typing import List, Optional, Set, Tuple, Union
 
+from sqlalchemy.exc import IntegrityError
 from sxm.models import XMCutMarker, XMEpisodeMarker, XMSong
 
 from sxm_player.models import DBEpisode, DBSong
 from sxm_player.utils import (
+    chunked,
     from_fs_datetime,
     get_art_thumb_url,
     get_art_url_by_size,
-    get_files,
-    splice_file,
+    get_file_entries,
+    splice_files,
 )
 from sxm_player.workers.archiver import ARCHIVE_CHUNK
 from sxm_player.workers.base import HLSLoopedWorker
@@ -20,6 +25,17 @@ __all__ = ["ProcessorWorker"]
 
 MAX_DUPLICATE_COUNT = 3
 CUT_PADDING = timedelta(seconds=20)
+PATH_FILTER_REPLACEMENTS = {
+    "Counterfeit.": "Counterfeit",
+    "F**ker": "Fucker",
+    "Trust?": "Trust",
+    "P.O.D.": "POD",
+    "//": "-",
+    "@": "",
+    "(": "",
+    ")": "",
+}
+PATH_FILTER_REGEX = re.compile("|".join(map(re.escape, PATH_FILTER_REPLACEMENTS)))
 
 
 class ProcessorWorker(HLSLoopedWorker):
@@ -66,47 +82,50 @@ class ProcessorWorker(HLSLoopedWorker):
         channel_archive = os.path.join(self.archive_folder, self._state.stream_channel)
         os.makedirs(channel_archive, exist_ok=True)
 
-        archives = {}
-        archive_files = get_files(channel_archive)
-        for archive_file in archive_files:
-            file_parts = archive_file.split(".")
-            archive_key = f"{file_parts[1]}.{file_parts[2]}"
-            archives[archive_key] = os.path.join(channel_archive, archive_file)
-        self._log.debug(f"found {len(archives.keys())}")
+        # parse archive times once per loop instead of once per cut,
+        # sorted by start time so cuts can bisect into them
+        archives: List[Tuple[datetime, datetime, str]] = []
+        for entry in get_file_entries(channel_archive):
+            file_parts = entry.name.split(".")
+            archives.append(
+                (
+                    from_fs_datetime(file_parts[1]),
+                    from_fs_datetime(file_parts[2]),
+                    entry.path,
+                )
+            )
+        archives.sort()
+        self._log.debug("found %s", len(archives))
 
         processed_songs = self._process_cuts(archives, self._state.live.song_cuts)
         processed_shows = self._process_cuts(archives, self._state.live.episode_markers)
 
-        self._log.info(f"processed: {processed_songs} songs, {processed_shows} shows")
+        self._log.info(
+            "processed: %s songs, %s shows", processed_songs, processed_shows
+        )
 
     def _path_filter(self, word: str) -> str:
         """Filters out known words to call issues for creating
         names for folders/files"""
 
-        return (
-            word.replace("Counterfeit.", "Counterfeit")
-            .replace("F**ker", "Fucker")
-            .replace("Trust?", "Trust")
-            .replace("P.O.D.", "POD")
-            .replace("//", "-")
-            .replace("@", "")
-            .replace("(", "")
-            .replace(")", "")
-            .strip()
-        )
+        return PATH_FILTER_REGEX.sub(
+            lambda match: PATH_FILTER_REPLACEMENTS[match.group(0)], word
+        ).strip()
 
-    def _process_cut(
-        self, archives: Dict[str, str], cut: Union[XMCutMarker, XMEpisodeMarker]
-    ) -> bool:
-        """Processes `archives` to splice out an
-        instance of `XMMarker` if it exists"""
+    def _prepare_cut(
+        self,
+        archives: List[Tuple[datetime, datetime, str]],
+        cut: Union[XMCutMarker, XMEpisodeMarker],
+    ) -> Optional[Tuple[Tuple[str, str, int, int], Union[DBSong, DBEpisode]]]:
+        """Finds the archive containing an instance of `XMMarker` and
+        returns the `splice_files` job for it along with its DB item"""
 
         if (
             self.processed_folder is None
             or self._state.stream_channel is None
             or self._state.db is None
         ):
-            return False
+            return None
 
         archive = None
         start = cut.time + CUT_PADDING
@@ -115,116 +134,143 @@ class ProcessorWorker(HLSLoopedWorker):
         end = start + padded_duration
         splice_end = timedelta(seconds=0)
 
-        for archive_key, archive_file in archives.items():
-            archive_start, archive_end = [
-                from_fs_datetime(i) for i in archive_key.split(".")
-            ]
-
-            if archive_start < start and archive_end > end:
+        # only archives before `bisect_left` start before the cut,
+        # check the latest starting ones first
+        index = bisect_left(archives, (start,))
+        for archive_start, archive_end, archive_file in reversed(archives[:index]):
+            if archive_end > end:
                 archive = archive_file
                 splice_start = start - archive_start
                 splice_end = splice_start + padded_duration
                 break
 
-        if archive is not None:
-            self._log.debug(f"found archive {archive}")
+        if archive is None:
+            return None
 
-            title = None
-            album_or_show = None
-            album_url = None
-            artist = None
-            filename = None
-            folder = os.path.join(self.processed_folder, self._state.stream_channel)
+        self._log.debug("found archive %s", archive)
 
-            if isinstance(cut, XMEpisodeMarker):
-                title = self._path_filter(
-                    cut.episode.long_title or cut.episode.medium_title
-                )
+        title = None
+        album_or_show = None
+        album_url = None
+        artist = None
+        folder = os.path.join(self.processed_folder, self._state.stream_channel)
 
-                if cut.episode.show is not None:
-                    album_or_show = self._path_filter(
-                        cut.episode.show.long_title or cut.episode.show.medium_title
-                    )
-                    album_url = get_art_thumb_url(cut.episode.show.arts)
+        if isinstance(cut, XMEpisodeMarker):
+            title = self._path_filter(
+                cut.episode.long_title or cut.episode.medium_title
+            )
 
-                filename = (
-                    f'{title}.{cut.time.strftime("%Y-%m-%d-%H.%M")}' f".{cut.guid}.mp3"
+            if cut.episode.show is not None:
+                album_or_show = self._path_filter(
+                    cut.episode.show.long_title or cut.episode.show.medium_title
                 )
-                folder = os.path.join(folder, "shows")
-            elif isinstance(cut.cut, XMSong):
-                title = self._path_filter(cut.cut.title)
-                artist = self._path_filter(cut.cut.artists[0].name)
+                album_url = get_art_thumb_url(cut.episode.show.arts)
 
-                if cut.cut.album is not None and cut.cut.album.title is not None:
-                    album_or_show = self._path_filter(cut.cut.album.title)
-                    album_url = get_art_url_by_size(cut.cut.album.arts, "MEDIUM")
+            filename = (
+                f'{title}.{cut.time.strftime("%Y-%m-%d-%H.%M")}' f".{cut.guid}.mp3"
+            )
+            folder = os.path.join(folder, "shows")
+        elif isinstance(cut.cut, XMSong):
+            title = self._path_filter(cut.cut.title)
+            artist = self._path_filter(cut.cut.artists[0].name)
+
+            if cut.cut.album is not None and cut.cut.album.title is not None:
+                album_or_show = self._path_filter(cut.cut.album.title)
+                album_url = get_art_url_by_size(cut.cut.album.arts, "MEDIUM")
+
+            filename = f"{title}.{cut.guid}.mp3"
+            folder = os.path.join(folder, "songs", artist)
+        else:
+            return None
 
-                filename = f"{title}.{cut.guid}.mp3"
-                folder = os.path.join(folder, "songs", artist)
-            else:
-                return False
-
-            if album_or_show is not None:
-                folder = os.path.join(folder, album_or_show)
-
-            os.makedirs(folder, exist_ok=True)
-            path: Optional[str] = os.path.join(folder, filename)
-            self._log.debug(f"{cut.duration}: {path}")
-            if path is not None:
-                self._log.debug(
-                    f"Splice song: (Song: {start}, {end}, {cut.duration}), "
-                    f"(Archive: {archive}, {splice_start}, {splice_end}"
-                )
-                path = splice_file(
-                    archive,
-                    path,
-                    int(splice_start.total_seconds()),
-                    int(splice_end.total_seconds()),
-                )
+        if album_or_show is not None:
+            folder = os.path.join(folder, album_or_show)
+
+        path = os.path.join(folder, filename)
+        self._log.debug("%s: %s", cut.duration, path)
+        self._log.debug(
+            "Splice song: (Song: %s, %s, %s), (Archive: %s, %s, %s",
+            start,
+            end,
+            cut.duration,
+            archive,
+            splice_start,
+            splice_end,
+        )
+
+        if isinstance(cut, XMEpisodeMarker):
+            db_item: Union[DBSong, DBEpisode] = DBEpisode(
+                guid=cut.guid,
+                title=title,
+                show=album_or_show,
+                air_time=cut.time,
+                channel=self._state.stream_channel,
+                file_path=path,
+                image_url=album_url,
+            )
+        else:
+            db_item = DBSong(
+                guid=cut.guid,
+                title=title,
+                artist=artist,
+                album=album_or_show,
+                air_time=cut.time,
+                channel=self._state.stream_channel,
+                file_path=path,
+                image_url=album_url,
+            )
+
+        job = (
+            archive,
+            path,
+            int(splice_start.total_seconds()),
+            int(splice_end.total_seconds()),
+        )
+        return (job, db_item)
 
-            if path is not None:
-                if os.path.getsize(path) < 1000:
-                    self._log.error(
-                        f"spliced file too small, deleting {path}: {archive}"
-                    )
-                    os.remove(path)
-                    return False
-
-                is_song = False
-                if isinstance(cut, XMEpisodeMarker):
-                    db_item: Union[DBSong, DBEpisode] = DBEpisode(
-                        guid=cut.guid,
-                        title=title,
-                        show=album_or_show,
-                        air_time=cut.time,
-                        channel=self._state.stream_channel,
-                        file_path=path,
-                        image_url=album_url,
-                    )
-                elif isinstance(cut.cut, XMSong):
-                    is_song = True
-                    db_item = DBSong(
-                        guid=cut.guid,
-                        title=title,
-                        artist=artist,
-                        album=album_or_show,
-                        air_time=cut.time,
-                        channel=self._state.stream_channel,
-                        file_path=path,
-                        image_url=album_url,
-                    )
-                else:
-                    return False
+    def _validate_cut(self, path: Optional[str]) -> bool:
+        """Checks a spliced cut actually has audio in it"""
 
+        if path is None:
+            return False
+
+        if os.path.getsize(path) < 1000:
+            self._log.error("spliced file too small, deleting %s", path)
+            os.remove(path)
+            return False
+        return True
+
+    def _save_cuts(self, db_items: List[Union[DBSong, DBEpisode]]) -> int:
+        """Adds processed cuts to the database in a single commit"""
+
+        if len(db_items) == 0 or self._state.db is None:
+            return 0
+
+        try:
+            self._state.db.add_all(db_items)
+            self._state.db.commit()
+        except IntegrityError:
+            self._state.db.rollback()
+        else:
+            self._log.debug("inserted %s cuts", len(db_items))
+            return len(db_items)
+
+        # fallback to one at a time so one bad row does not drop the batch
+        saved = 0
+        for db_item in db_items:
+            try:
                 self._state.db.add(db_item)
                 self._state.db.commit()
-                self._log.debug(f"inserted cut {is_song}: {db_item.guid}")
-                return True
-        return False
+            except IntegrityError:
+                self._state.db.rollback()
+                self._log.warning("could not insert cut: %s", db_item.guid)
+            else:
+                saved += 1
+        return saved
 
     def _process_cuts(
         self,
-        archives: Dict[str, str],
+        archives: List[Tuple[datetime, datetime, str]],
         cuts: Union[List[XMCutMarker], List[XMEpisodeMarker]],
     ) -> int:
         """Processes `archives` to splice out any
@@ -233,29 +279,22 @@ class ProcessorWorker(HLSLoopedWorker):
         if self._state.live is None or self._state.db is None:
             return 0
 
-        processed = 0
-        for cut in cuts:
-            if cut.duration == 0.0:
-                continue
+        valid_cuts: List[Union[XMCutMarker, XMEpisodeMarker]] = [
+            cut for cut in cuts if cut.duration != 0.0
+        ]
+        existing_guids, song_counts = self._get_existing(valid_cuts)
 
-            db_item: Union[DBSong, DBEpisode, None] = None
-            if isinstance(cut, XMEpisodeMarker):
-                db_item = (
-                    self._state.db.query(DBEpisode).filter_by(guid=cut.guid).first()
-                )
-            elif isinstance(cut.cut, XMSong):
-                existing = (
-                    self._state.db.query(DBSong)
-                    .filter_by(title=cut.cut.title, artist=cut.cut.artists[0].name)
-                    .all()
-                )
+        jobs: List[Tuple[str, str, int, int]] = []
+        db_items: List[Union[DBSong, DBEpisode]] = []
+        for cut in valid_cuts:
+            song_key: Optional[Tuple[str, str]] = None
+            if not isinstance(cut, XMEpisodeMarker) and isinstance(cut.cut, XMSong):
+                song_key = (cut.cut.title, cut.cut.artists[0].name)
 
-                if len(existing) >= MAX_DUPLICATE_COUNT:
+                if song_counts[song_key] >= MAX_DUPLICATE_COUNT:
                     continue
 
-                db_item = self._state.db.query(DBSong).filter_by(guid=cut.guid).first()
-
-            if db_item is not None:
+            if cut.guid in existing_guids:
                 continue
 
             title: Optional[str] = None
@@ -267,10 +306,63 @@ class ProcessorWorker(HLSLoopedWorker):
             if title is None:
                 title = "unknown"
             self._log.debug(
-                f"processing {title}: " f"{cut.time}: {cut.duration}" f"{cut.guid}"
+                "processing %s: %s: %s%s", title, cut.time, cut.duration, cut.guid
+            )
+            prepared = self._prepare_cut(archives, cut)
+
+            if prepared is not None:
+                jobs.append(prepared[0])
+                db_items.append(prepared[1])
+
+                # count queued cuts so repeats in this batch are skipped too
+                existing_guids.add(cut.guid)
+                if song_key is not None:
+                    song_counts[song_key] += 1
+
+        # splicing is the slow part, so run the ffmpeg jobs in parallel
+        paths = splice_files(jobs)
+
+        return self._save_cuts(
+            [
+                db_item
+                for db_item, path in zip(db_items, paths)
+                if self._validate_cut(path)
+            ]
+        )
+
+    def _get_existing(
+        self, cuts: List[Union[XMCutMarker, XMEpisodeMarker]]
+    ) -> Tuple[Set[str], "Counter[Tuple[str, str]]"]:
+        """Looks up which `cuts` are already processed and how many
+        copies of each song already exist, in bulk instead of per cut"""
+
+        existing_guids: Set[str] = set()
+        song_counts: "Counter[Tuple[str, str]]" = Counter()
+        if self._state.db is None:
+            return existing_guids, song_counts
+
+        episode_guids = [cut.guid for cut in cuts if isinstance(cut, XMEpisodeMarker)]
+        songs = [
+            cut
+            for cut in cuts
+            if not isinstance(cut, XMEpisodeMarker) and isinstance(cut.cut, XMSong)
+        ]
+
+        # chunked to stay under SQLite's bound parameter limit
+        for guids in chunked(episode_guids):
+            query = self._state.db.query(DBEpisode.guid).filter(
+                DBEpisode.guid.in_(guids)
+            )
+            existing_guids.update(guid for (guid,) in query)
+
+        for guids in chunked(cut.guid for cut in songs):
+            query = self._state.db.query(DBSong.guid).filter(DBSong.guid.in_(guids))
+            existing_guids.update(guid for (guid,) in query)
+
+        for titles in chunked({cut.cut.title for cut in songs}):
+            query = self._state.db.query(DBSong.title, DBSong.artist).filter(
+                DBSong.title.in_(titles)
             )
-            success = self._process_cut(archives, cut)
+            song_counts.update((title, artist) for (title, artist) in query)
 
-            if success:
-                processed += 1
-        return processed
+        return existing_guids, song_counts
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Callable
 
@@ -8,6 +9,12 @@ from ..queue import EventMessage, EventTypes
 from ..signals import TerminateInterrupt
 from .base import InterruptableWorker
 
+# uvloop is optional (`pip install sxm-player[uvloop]`)
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None  # type: ignore
+
 __all__ = ["ServerWorker"]
 
 
@@ -35,6 +42,13 @@ class ServerWorker(InterruptableWorker):
     ):
         super().__init__(*args, **kwargs)
 
+        # must be set before SXMClient is created so its async
+        # client is bound to the same loop `web.run_app` runs on
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        else:
+            self._log.debug("uvloop not installed, using default asyncio loop")
+
         self._port = port
         self._ip = ip
         self._precache = precache
@@ -79,7 +93,9 @@ class ServerWorker(InterruptableWorker):
             make_http_handler(self.sxm.async_client, precache=self._precache),
         )
         try:
-            self._log.info(f"{self.name} has started on http://{self._ip}:{self._port}")
+            self._log.info(
+                "%s has started on http://%s:%s", self.name, self._ip, self._port
+            )
             web.run_app(
                 app,
                 host=self._ip,
@@ -15,6 +15,7 @@ class StatusWorker(SXMLoopedWorker):
     _port: int
     _delay: float = 30.0
     _failures: int = 0
+    _client: httpx.Client
 
     def __init__(self, port: int, ip: str, *args, **kwargs):
 
@@ -25,14 +26,19 @@ class StatusWorker(SXMLoopedWorker):
 
         self._ip = ip
         self._port = port
+        # reuse the same connection for every status check
+        self._client = httpx.Client()
 
     def loop(self):
         self.check_sxm()
 
+    def cleanup(self):
+        self._client.close()
+
     def check_sxm(self):
         if self._state.sxm_running:
             self._log.debug("Checking SXM Client")
-            r = httpx.get(f"http://{self._ip}:{self._port}/channels/")
+            r = self._client.get(f"http://{self._ip}:{self._port}/channels/")
 
             if r.is_error:
                 # adjust delay to check more often